@@ -7,26 +7,83 @@ Usage:
     python api/api_client.py
 """
 
-import requests
-import json
-from typing import Dict, List, Any
+import asyncio
+import httpx
+import orjson
+from typing import Dict, Iterator, List, Any, Optional
+
+
+# Largest batch the server accepts per request
+MAX_BATCH_SIZE = 100
+
+# Encoded tail of every request body, one per (include_emotions, include_keywords)
+# combination, so only the text part is serialized per call
+_FLAG_SUFFIXES = {
+    (emotions, keywords): orjson.dumps({
+        "include_emotions": emotions,
+        "include_keywords": keywords
+    }).replace(b"{", b",", 1)
+    for emotions in (True, False)
+    for keywords in (True, False)
+}
 
 
 class SentimentScopeClient:
-    """Client for interacting with SentimentScope API"""
+    """
+    Client for interacting with SentimentScope API
     
-    def __init__(self, base_url: str = "http://localhost:8000", api_key: str = None):
+    Keeps a persistent connection pool so repeated calls reuse the same
+    TCP connection. Use it as a context manager (or call close()) to
+    release the pool when done.
+    """
+    
+    def __init__(self, base_url: str = "http://localhost:8000", api_key: str = None,
+                 timeout: float = 30.0):
         """
         Initialize API client
         
         Args:
             base_url: Base URL of the API server
             api_key: Optional API key for authentication
+            timeout: Request timeout in seconds
         """
         self.base_url = base_url
         self.headers = {"Content-Type": "application/json"}
         if api_key:
             self.headers["X-API-Key"] = api_key
+        
+        self._limits = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+        self._timeout = timeout
+        self._client = httpx.Client(
+            base_url=base_url,
+            headers=self.headers,
+            limits=self._limits,
+            timeout=timeout
+        )
+        self._aclient: Optional[httpx.AsyncClient] = None  # Created on first async call
+    
+    def _analyze_payload(self, text: str, include_emotions: bool,
+                         include_keywords: bool) -> bytes:
+        """Build the encoded request body for /api/v1/analyze"""
+        return (b'{"text":' + orjson.dumps(text)
+                + _FLAG_SUFFIXES[bool(include_emotions), bool(include_keywords)])
+    
+    def _batch_payload(self, texts: List[str], include_emotions: bool,
+                       include_keywords: bool) -> bytes:
+        """Build the encoded request body for /api/v1/batch"""
+        return (b'{"texts":' + orjson.dumps(texts)
+                + _FLAG_SUFFIXES[bool(include_emotions), bool(include_keywords)])
+    
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Create the async connection pool on first use"""
+        if self._aclient is None:
+            self._aclient = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                limits=self._limits,
+                timeout=self._timeout
+            )
+        return self._aclient
     
     def analyze(self, text: str, include_emotions: bool = True, 
                 include_keywords: bool = True) -> Dict[str, Any]:
@@ -41,16 +98,11 @@ class SentimentScopeClient:
         Returns:
             Analysis results dictionary
         """
-        endpoint = f"{self.base_url}/api/v1/analyze"
-        payload = {
-            "text": text,
-            "include_emotions": include_emotions,
-            "include_keywords": include_keywords
-        }
-        
-        response = requests.post(endpoint, json=payload, headers=self.headers)
+        payload = self._analyze_payload(text, include_emotions, include_keywords)
+        
+        response = self._client.post("/api/v1/analyze", content=payload)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
     
     def batch_analyze(self, texts: List[str], include_emotions: bool = True,
                      include_keywords: bool = True) -> Dict[str, Any]:
@@ -65,16 +117,35 @@ class SentimentScopeClient:
         Returns:
             Batch analysis results dictionary
         """
-        endpoint = f"{self.base_url}/api/v1/batch"
-        payload = {
-            "texts": texts,
-            "include_emotions": include_emotions,
-            "include_keywords": include_keywords
-        }
-        
-        response = requests.post(endpoint, json=payload, headers=self.headers)
+        payload = self._batch_payload(texts, include_emotions, include_keywords)
+        
+        response = self._client.post("/api/v1/batch", content=payload)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
+    
+    def batch_analyze_stream(self, texts: List[str], include_emotions: bool = True,
+                             include_keywords: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Analyze multiple texts, yielding each result as the server finishes it
+        
+        Results arrive in completion order, not request order; use each
+        item's ``index`` to map it back to its text.
+        
+        Args:
+            texts: List of texts to analyze
+            include_emotions: Include emotion detection results
+            include_keywords: Include advanced keywords
+            
+        Yields:
+            Dictionaries with ``index``, ``success`` and ``data`` (or ``error``)
+        """
+        payload = self._batch_payload(texts, include_emotions, include_keywords)
+        
+        with self._client.stream("POST", "/api/v1/batch/stream", content=payload) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if line:
+                    yield orjson.loads(line)
     
     def health_check(self) -> Dict[str, Any]:
         """
@@ -83,10 +154,90 @@ class SentimentScopeClient:
         Returns:
             Health status dictionary
         """
-        endpoint = f"{self.base_url}/api/v1/health"
-        response = requests.get(endpoint, headers=self.headers)
+        response = self._client.get("/api/v1/health")
+        response.raise_for_status()
+        return orjson.loads(response.content)
+    
+    async def aanalyze(self, text: str, include_emotions: bool = True,
+                       include_keywords: bool = True) -> Dict[str, Any]:
+        """
+        Async version of analyze()
+        
+        Several calls can run concurrently, e.g.
+        ``await asyncio.gather(*[client.aanalyze(t) for t in texts])``.
+        """
+        payload = self._analyze_payload(text, include_emotions, include_keywords)
+        
+        client = self._get_async_client()
+        response = await client.post("/api/v1/analyze", content=payload)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+    
+    async def abatch_analyze(self, texts: List[str], include_emotions: bool = True,
+                             include_keywords: bool = True) -> Dict[str, Any]:
+        """Async version of batch_analyze()"""
+        payload = self._batch_payload(texts, include_emotions, include_keywords)
+        
+        client = self._get_async_client()
+        response = await client.post("/api/v1/batch", content=payload)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
+    
+    async def analyze_many(self, texts: List[str], concurrency: int = 8,
+                           include_emotions: bool = True,
+                           include_keywords: bool = True) -> List[Dict[str, Any]]:
+        """
+        Analyze any number of texts with several batch requests in flight
+        
+        Texts are split into batches of MAX_BATCH_SIZE. At most
+        ``concurrency`` batches are sent at once. Around 8 usually keeps the
+        server busy; raise it only while the server has spare CPU, since
+        beyond that requests just queue up server-side.
+        
+        Args:
+            texts: Texts to analyze
+            concurrency: Maximum number of batch requests in flight
+            include_emotions: Include emotion detection results
+            include_keywords: Include advanced keywords
+            
+        Returns:
+            Analysis results in the same order as ``texts``
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def send(chunk: List[str]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                response = await self.abatch_analyze(chunk, include_emotions, include_keywords)
+            return response["results"]
+        
+        batches = await asyncio.gather(*[
+            send(texts[i:i + MAX_BATCH_SIZE])
+            for i in range(0, len(texts), MAX_BATCH_SIZE)
+        ])
+        return [result for batch in batches for result in batch]
+    
+    def close(self):
+        """Close the connection pool"""
+        self._client.close()
+    
+    async def aclose(self):
+        """Close both the async and the sync connection pools"""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+        self._client.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
 
 
 # Example usage
@@ -137,6 +288,7 @@ if __name__ == "__main__":
         print(f"  {i}. {res['label']} - {res['emotions']['primary_emotion']}")
     
     print()
+    client.close()
     print("=" * 70)
     print("✅ All API calls successful!")
     print("=" * 70)
@@ -6,34 +6,82 @@ Provides REST API endpoints for programmatic access to sentiment analysis.
 Endpoints:
 - POST /api/v1/analyze - Analyze single text
 - POST /api/v1/batch - Analyze multiple texts
+- POST /api/v1/batch/stream - Analyze multiple texts, streamed as NDJSON
 - GET /api/v1/health - Health check
 - GET /api/v1/stats - Usage statistics
+- POST /api/v1/cache/clear - Clear the result cache
 
-Usage:
+Usage (from the project root):
     python -m uvicorn api.api_server:app --reload --port 8000
+    python -m api.api_server
 """
 
-from fastapi import FastAPI, HTTPException, Depends, Header
+from fastapi import FastAPI, HTTPException, Depends, Header, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, validator
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, field_validator
 from typing import List, Optional, Dict, Any
+from typing_extensions import Annotated
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from cachetools import TTLCache
+import asyncio
+import hashlib
+import orjson
+import os
+import re
 import time
 
-# Import sentiment analyzer
+# Make the sentiment package importable
 import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
-from sentiment.analyzer import SentimentAnalyzer
+
+# Run as a script this module is __main__ (__mp_main__ in uvicorn's worker
+# processes). Register it under its package name so uvicorn's
+# "api.api_server:app" import reuses it instead of executing the module,
+# and creating a second worker pool, all over again.
+if __name__ in ("__main__", "__mp_main__"):
+    sys.modules.setdefault("api.api_server", sys.modules[__name__])
+
+# Worker pool for running the blocking analyzer off the event loop
+WORKER_COUNT = os.cpu_count() or 1
+executor = ThreadPoolExecutor(max_workers=WORKER_COUNT)
+
+
+def _load_analyzer():
+    """
+    Import and construct the sentiment analyzer
+    
+    The import pulls in TextBlob and checks the NLTK corpora, so it is
+    deferred until the server starts rather than paid at module import.
+    """
+    from sentiment.analyzer import SentimentAnalyzer
+    return SentimentAnalyzer()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load the analyzer once per worker without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    app.state.analyzer = await loop.run_in_executor(executor, _load_analyzer)
+    yield
+
+
+API_VERSION = "1.0.0"
 
 # Initialize FastAPI app
 app = FastAPI(
     title="SentimentScope API",
     description="RESTful API for sentiment analysis and emotion detection",
-    version="1.0.0",
+    version=API_VERSION,
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS middleware for cross-origin requests
@@ -45,38 +93,176 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize analyzer
-analyzer = SentimentAnalyzer()
+# NDJSON streaming route; kept out of gzip so each line is sent as it is ready
+STREAM_PATH = "/api/v1/batch/stream"
+
+
+class _StreamAwareGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that passes the given paths through uncompressed"""
+    
+    def __init__(self, app, excluded_paths=(), **kwargs):
+        super().__init__(app, **kwargs)
+        self.excluded_paths = frozenset(excluded_paths)
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# Compress larger responses (batch results are highly repetitive JSON). The
+# streaming route is excluded: the compressor would hold its lines back.
+app.add_middleware(_StreamAwareGZipMiddleware, excluded_paths=(STREAM_PATH,),
+                   minimum_size=1024, compresslevel=5)
+
+# Cache of filtered results keyed by _cache_key(). Only touched from the
+# event loop thread, so no lock is needed. Cached results are shared between
+# responses and must be treated as read-only. Entries expire after five
+# minutes (see the REST API section of SECURITY.md).
+result_cache = TTLCache(maxsize=1024, ttl=300)
+
+
+def _cache_key(text: str, include_emotions: bool, include_keywords: bool) -> tuple:
+    """
+    Result cache key for one request
+    
+    The text is reduced to a blake2b digest, so the cache never holds the
+    raw input as a key.
+    """
+    digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    return (digest, include_emotions, include_keywords)
+
+
+def _now_iso() -> str:
+    """Current local time as an ISO 8601 string"""
+    return datetime.now().isoformat()
+
+
+@lru_cache(maxsize=1)
+def _iso_for_second(second: int) -> str:
+    return datetime.fromtimestamp(second).isoformat()
+
+
+def _coarse_now_iso() -> str:
+    """
+    ISO timestamp with one-second resolution, formatted once per second
+    
+    Used by the status endpoints, which monitors may poll at high rates.
+    """
+    return _iso_for_second(int(time.time()))
+
+
+async def _analyze_in_pool(analyzer, text: str, include_emotions: bool,
+                           include_keywords: bool) -> Dict[str, Any]:
+    """
+    Analyze one text in the worker pool, going through the result cache
+    
+    Cache hits return without leaving the event loop.
+    """
+    key = _cache_key(text, include_emotions, include_keywords)
+    result = result_cache.get(key)
+    
+    if result is None:
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            executor, analyzer.analyze, text, include_emotions, include_keywords
+        )
+        result_cache[key] = result
+    
+    return result
+
+
+def _analyze_chunk(analyzer, texts: List[str], include_emotions: bool,
+                   include_keywords: bool) -> List[Dict[str, Any]]:
+    """Analyze a run of texts inside a single worker task"""
+    return [analyzer.analyze(text, include_emotions, include_keywords) for text in texts]
+
+
+async def _analyze_batch_in_pool(analyzer, texts: List[str], include_emotions: bool,
+                                 include_keywords: bool) -> List[Dict[str, Any]]:
+    """
+    Analyze a batch in the worker pool, one task per chunk of texts
+    
+    Each distinct text is analyzed once, however often it repeats in the
+    batch. Texts missing from the result cache are split into at most one
+    chunk per worker, so a batch costs a handful of executor round trips
+    rather than one per text.
+    """
+    by_text: Dict[str, Optional[Dict[str, Any]]] = {
+        text: result_cache.get(_cache_key(text, include_emotions, include_keywords))
+        for text in texts
+    }
+    misses = [text for text, result in by_text.items() if result is None]
+    
+    if misses:
+        chunk_size = -(-len(misses) // WORKER_COUNT)
+        chunks = [misses[i:i + chunk_size] for i in range(0, len(misses), chunk_size)]
+        
+        loop = asyncio.get_running_loop()
+        analyzed = await asyncio.gather(*[
+            loop.run_in_executor(executor, _analyze_chunk, analyzer, chunk,
+                                 include_emotions, include_keywords)
+            for chunk in chunks
+        ])
+        
+        for chunk, chunk_results in zip(chunks, analyzed):
+            for text, result in zip(chunk, chunk_results):
+                by_text[text] = result_cache[_cache_key(text, include_emotions, include_keywords)] = result
+    
+    return [by_text[text] for text in texts]
+
+
+# Request limits
+MAX_TEXT_LENGTH = 10000
+MAX_BATCH_SIZE = 100
+
+# Finds the first non-whitespace character without copying the text
+_NON_WHITESPACE = re.compile(r'\S')
+
+# Static parts of the status responses; only the timestamp changes per call
+_HEALTH_STATIC = {
+    "status": "healthy",
+    "version": API_VERSION
+}
+
+_STATS_STATIC = {
+    "success": True,
+    "data": {
+        "api_version": API_VERSION,
+        "endpoints_available": 6,
+        "features": [
+            "Single text analysis",
+            "Batch processing",
+            "Emotion detection",
+            "Advanced keyword extraction"
+        ]
+    }
+}
+
 
 # Request/Response models
 class AnalyzeRequest(BaseModel):
     """Request model for single text analysis"""
-    text: str
+    # Size limits are Field constraints so pydantic-core enforces them
+    # before any Python validator runs
+    text: str = Field(max_length=MAX_TEXT_LENGTH)
     include_emotions: bool = True
     include_keywords: bool = True
     
-    @validator('text')
+    @field_validator('text')
+    @classmethod
     def text_not_empty(cls, v):
-        if not v or not v.strip():
+        if not _NON_WHITESPACE.search(v):
             raise ValueError('Text cannot be empty')
-        if len(v) > 10000:
-            raise ValueError('Text too long (max 10000 characters)')
         return v
 
 
 class BatchAnalyzeRequest(BaseModel):
     """Request model for batch text analysis"""
-    texts: List[str]
+    texts: List[str] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
     include_emotions: bool = True
     include_keywords: bool = True
-    
-    @validator('texts')
-    def texts_valid(cls, v):
-        if not v or len(v) == 0:
-            raise ValueError('Texts list cannot be empty')
-        if len(v) > 100:
-            raise ValueError('Maximum 100 texts per batch')
-        return v
 
 
 class AnalyzeResponse(BaseModel):
@@ -104,7 +290,7 @@ class HealthResponse(BaseModel):
 
 
 # API key validation (simplified - in production use proper auth)
-async def verify_api_key(x_api_key: Optional[str] = Header(None)):
+async def verify_api_key(x_api_key: Annotated[Optional[str], Header()] = None) -> str:
     """Verify API key from header (optional, for rate limiting)"""
     # In production, implement proper API key validation
     # For now, just check if provided
@@ -113,6 +299,32 @@ async def verify_api_key(x_api_key: Optional[str] = Header(None)):
     return "anonymous"
 
 
+ApiKey = Annotated[str, Depends(verify_api_key)]
+
+
+async def require_api_key(x_api_key: Annotated[Optional[str], Header()] = None) -> str:
+    """Verify API key from header, rejecting anonymous callers"""
+    if not x_api_key:
+        raise HTTPException(status_code=401, detail="X-API-Key header required")
+    return x_api_key
+
+
+RequiredApiKey = Annotated[str, Depends(require_api_key)]
+
+
+def get_analyzer(request: Request):
+    """
+    Analyzer loaded by the lifespan handler
+    
+    Falls back to loading on first use when the app runs without its
+    lifespan (e.g. mounted inside another application).
+    """
+    state = request.app.state
+    if getattr(state, "analyzer", None) is None:
+        state.analyzer = _load_analyzer()
+    return state.analyzer
+
+
 # Endpoints
 @app.get("/api/v1/health", response_model=HealthResponse)
 async def health_check():
@@ -121,17 +333,14 @@ async def health_check():
     
     Returns API status and version information.
     """
-    return HealthResponse(
-        status="healthy",
-        version="1.0.0",
-        timestamp=datetime.now().isoformat()
-    )
+    return ORJSONResponse({**_HEALTH_STATIC, "timestamp": _coarse_now_iso()})
 
 
 @app.post("/api/v1/analyze", response_model=AnalyzeResponse)
 async def analyze_text(
     request: AnalyzeRequest,
-    api_key: str = Depends(verify_api_key)
+    api_key: ApiKey,
+    analyzer=Depends(get_analyzer)
 ):
     """
     Analyze sentiment of a single text
@@ -143,24 +352,21 @@ async def analyze_text(
     Returns:
         AnalyzeResponse with sentiment analysis results
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     try:
-        # Perform analysis
-        result = analyzer.analyze(request.text)
-        
-        # Filter response based on options
-        if not request.include_emotions:
-            result.pop('emotions', None)
-        if not request.include_keywords:
-            result.pop('advanced_keywords', None)
+        # Analyze in the worker pool so the event loop stays free, skipping
+        # the sections not requested
+        result = await _analyze_in_pool(
+            analyzer, request.text, request.include_emotions, request.include_keywords
+        )
         
-        processing_time = (time.time() - start_time) * 1000
+        processing_time = (time.perf_counter_ns() - start_ns) / 1_000_000
         
         return AnalyzeResponse(
             success=True,
             data=result,
-            timestamp=datetime.now().isoformat(),
+            timestamp=_now_iso(),
             processing_time_ms=round(processing_time, 2)
         )
     
@@ -171,7 +377,8 @@ async def analyze_text(
 @app.post("/api/v1/batch", response_model=BatchAnalyzeResponse)
 async def batch_analyze(
     request: BatchAnalyzeRequest,
-    api_key: str = Depends(verify_api_key)
+    api_key: ApiKey,
+    analyzer=Depends(get_analyzer)
 ):
     """
     Analyze sentiment of multiple texts in batch
@@ -183,29 +390,21 @@ async def batch_analyze(
     Returns:
         BatchAnalyzeResponse with analysis results for all texts
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     try:
-        # Perform batch analysis
-        results = []
-        for text in request.texts:
-            result = analyzer.analyze(text)
-            
-            # Filter based on options
-            if not request.include_emotions:
-                result.pop('emotions', None)
-            if not request.include_keywords:
-                result.pop('advanced_keywords', None)
-                
-            results.append(result)
+        # Analyze in the worker pool so the event loop stays free
+        results = await _analyze_batch_in_pool(
+            analyzer, request.texts, request.include_emotions, request.include_keywords
+        )
         
-        processing_time = (time.time() - start_time) * 1000
+        processing_time = (time.perf_counter_ns() - start_ns) / 1_000_000
         
         return BatchAnalyzeResponse(
             success=True,
             results=results,
             total_processed=len(results),
-            timestamp=datetime.now().isoformat(),
+            timestamp=_now_iso(),
             processing_time_ms=round(processing_time, 2)
         )
     
@@ -213,50 +412,96 @@ async def batch_analyze(
         raise HTTPException(status_code=500, detail=f"Batch analysis failed: {str(e)}")
 
 
+@app.post(STREAM_PATH)
+async def batch_analyze_stream(
+    request: BatchAnalyzeRequest,
+    api_key: ApiKey,
+    analyzer=Depends(get_analyzer)
+):
+    """
+    Analyze multiple texts and stream each result as soon as it is ready
+    
+    Emits newline-delimited JSON, one object per text, in completion order.
+    Each line carries the position of its text in the request as ``index``.
+    A failed text produces a line with ``success: false`` instead of
+    aborting the whole stream.
+    
+    Args:
+        request: BatchAnalyzeRequest with list of texts
+        api_key: API key from header (optional)
+        
+    Returns:
+        StreamingResponse with media type application/x-ndjson
+    """
+    async def analyze_one(index: int, text: str) -> Dict[str, Any]:
+        try:
+            result = await _analyze_in_pool(
+                analyzer, text, request.include_emotions, request.include_keywords
+            )
+            return {"index": index, "success": True, "data": result}
+        except Exception as e:
+            return {"index": index, "success": False, "error": f"Analysis failed: {str(e)}"}
+    
+    async def generate():
+        tasks = [analyze_one(i, text) for i, text in enumerate(request.texts)]
+        for next_line in asyncio.as_completed(tasks):
+            yield orjson.dumps(await next_line) + b"\n"
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @app.get("/api/v1/stats")
-async def get_stats(api_key: str = Depends(verify_api_key)):
+async def get_stats(api_key: ApiKey):
     """
     Get API usage statistics
     
     Returns statistics about API usage (placeholder for future implementation).
     """
-    return JSONResponse({
+    return ORJSONResponse({**_STATS_STATIC, "timestamp": _coarse_now_iso()})
+
+
+@app.post("/api/v1/cache/clear")
+async def clear_cache(api_key: RequiredApiKey):
+    """
+    Clear the analysis result cache
+    
+    Requires an X-API-Key header. The cache lives in each worker process,
+    so with several uvicorn workers only the worker serving this request
+    is cleared; the others expire their entries through the TTL.
+    
+    Returns the number of cached results that were discarded.
+    """
+    cleared = len(result_cache)
+    result_cache.clear()
+    
+    return ORJSONResponse({
         "success": True,
-        "data": {
-            "api_version": "1.0.0",
-            "endpoints_available": 4,
-            "features": [
-                "Single text analysis",
-                "Batch processing",
-                "Emotion detection",
-                "Advanced keyword extraction"
-            ]
-        },
-        "timestamp": datetime.now().isoformat()
+        "cleared": cleared,
+        "timestamp": _now_iso()
     })
 
 
 # Error handlers
 @app.exception_handler(404)
 async def not_found_handler(request, exc):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=404,
         content={
             "success": False,
             "error": "Endpoint not found",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }
     )
 
 
 @app.exception_handler(500)
 async def server_error_handler(request, exc):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "success": False,
             "error": "Internal server error",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }
     )
 
@@ -266,4 +511,13 @@ if __name__ == "__main__":
     print("🚀 Starting SentimentScope API Server...")
     print("📖 API Documentation: http://localhost:8000/api/docs")
     print("📊 ReDoc Documentation: http://localhost:8000/api/redoc")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop has no Windows build, so fall back to the stdlib loop there
+    uvicorn.run(
+        "api.api_server:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=int(os.environ.get("API_WORKERS", WORKER_COUNT)),
+        log_level="warning"
+    )
@@ -60,9 +60,8 @@ st.set_page_config(
 # CUSTOM CSS STYLING
 # ============================================================================
 
-# Inject custom CSS for professional and polished UI appearance
-# Using markdown with unsafe_allow_html=True to embed CSS styles
-st.markdown("""
+# Custom CSS for professional and polished UI appearance
+_CSS = """
     <style>
     /* Main content area padding for better spacing */
     .main {
@@ -103,7 +102,12 @@ st.markdown("""
         color: white;  /* White text for contrast */
     }
     </style>
-    """, unsafe_allow_html=True)  # Allow HTML/CSS injection (safe as it's our own code)
+    """
+
+# Inject the CSS using markdown with unsafe_allow_html=True.
+# This has to run on every rerun: Streamlit drops elements that a rerun does
+# not re-emit, so injecting only once per session would lose the styles.
+st.markdown(_CSS, unsafe_allow_html=True)  # Allow HTML/CSS injection (safe as it's our own code)
 
 # ============================================================================
 # SIDEBAR NAVIGATION AND STATS
@@ -51,8 +51,11 @@ Copyright (c) 2026
 import os
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Load environment variables from .env, unless the environment has already
+# been provided (e.g. injected by the deployment), in which case the file
+# read is skipped. Existing variables are never overridden.
+if "APP_TITLE" not in os.environ:
+    load_dotenv(override=False)
 
 # App Configuration
 APP_TITLE = os.getenv("APP_TITLE", "SentimentScope")
@@ -6,11 +6,18 @@ Author: Ishan Chakraborty
 License: MIT
 """
 
-from textblob import TextBlob, Word
-from typing import Dict, Tuple, List, Any
+from __future__ import annotations
+
+from textblob import TextBlob
+from textblob.en import sentiment as pattern_sentiment
+from textblob.exceptions import MissingCorpusError
+from typing import Any
 import re
 import html
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 import nltk
 import sys
 
@@ -42,6 +49,91 @@ except Exception as e:
     print(f"Warning: NLTK initialization failed: {e}", file=sys.stderr)
 
 
+# Preprocessing patterns, compiled once at import
+_SANITIZE_RE = re.compile(r'[^\w\s\.\!\?\,\;\:\-\']')
+_REPEAT_RE = re.compile(r'(.)\1{4,}')
+
+# Deletion table equivalent to _SANITIZE_RE for ASCII text, where
+# str.translate does the same job in a single C-level pass
+_SANITIZE_TABLE = {cp: None for cp in range(128) if _SANITIZE_RE.match(chr(cp))}
+
+# (label, emoji, color) returned by _classify_sentiment
+_POSITIVE = ("Positive", "😊", "#10b981")  # Green
+_NEGATIVE = ("Negative", "😠", "#ef4444")  # Red
+_NEUTRAL = ("Neutral", "😐", "#f59e0b")    # Yellow/Orange
+
+
+# Emotion keyword patterns (Plutchik's wheel of emotions)
+_EMOTION_KEYWORDS = {
+    "joy": ("happy", "joy", "delight", "pleasure", "love", "amazing", "wonderful",
+            "fantastic", "excellent", "great", "good", "glad", "cheerful", "excited"),
+    "sadness": ("sad", "unhappy", "depressed", "sorrow", "grief", "miserable",
+                "disappointed", "unfortunate", "terrible", "awful", "bad"),
+    "anger": ("angry", "mad", "furious", "rage", "hate", "irritated", "annoyed",
+              "frustrated", "outraged", "hostile"),
+    "fear": ("afraid", "scared", "fear", "terrified", "anxious", "worried",
+             "nervous", "panic", "frightened"),
+    "surprise": ("surprise", "amazed", "astonished", "shocked", "unexpected",
+                 "stunned", "wow"),
+    "disgust": ("disgust", "revolting", "gross", "nasty", "horrible", "repulsive"),
+    "trust": ("trust", "reliable", "confident", "secure", "safe", "believe"),
+    "anticipation": ("expect", "anticipate", "hope", "await", "eager", "looking forward"),
+}
+
+# The same table flattened to (keyword, emotion) pairs, so _detect_emotions
+# scans every keyword in one loop
+_EMOTION_KEYWORD_PAIRS = tuple(
+    (keyword, emotion)
+    for emotion, keywords in _EMOTION_KEYWORDS.items()
+    for keyword in keywords
+)
+
+# All-zero emotion scores, copied as the starting point of each detection
+_EMOTION_ZERO = dict.fromkeys(_EMOTION_KEYWORDS, 0)
+
+# Normalized scores and primary emotion reported when nothing scored (on an
+# all-zero tie the first emotion is the primary one)
+_EMOTION_ZERO_NORMALIZED = dict.fromkeys(_EMOTION_KEYWORDS, 0.0)
+_DEFAULT_PRIMARY_EMOTION = next(iter(_EMOTION_KEYWORDS)).capitalize()
+
+
+@lru_cache(maxsize=1)
+def _load_word_polarities() -> dict[str, float]:
+    """
+    Build a word -> polarity table from TextBlob's pattern lexicon
+    
+    For a single alphabetic word, TextBlob(word).sentiment.polarity is the
+    lexicon's part-of-speech-averaged polarity for the lowercased word, or
+    0.0 if the word is unknown, so a dict lookup gives the same score.
+    Built once per process and shared by all analyzer instances.
+    """
+    return {word: scores[None][0] for word, scores in pattern_sentiment.items()}
+
+
+@lru_cache(maxsize=1)
+def _warm_up_textblob() -> None:
+    """
+    Run one small text through the TextBlob steps the analyzer uses
+    
+    TextBlob shares one sentiment analyzer, noun phrase extractor and
+    tokenizers across all blobs, but loads their data on first use (the
+    noun phrase extractor trains on the Brown corpus). Doing that here,
+    once per process, keeps the cost out of the first real analysis.
+    
+    Missing NLTK corpora only skip the corpus-backed steps, so building an
+    analyzer never fails; keyword extraction reports the error when used.
+    """
+    blob = TextBlob("The quick service was really great.")
+    blob.sentiment
+    try:
+        blob.words
+        blob.noun_phrases
+    except (MissingCorpusError, LookupError) as e:
+        # MissingCorpusError's message is a multi-line download hint
+        print(f"Warning: TextBlob warm-up incomplete, NLTK data missing "
+              f"({type(e).__name__})", file=sys.stderr)
+
+
 class SentimentAnalyzer:
     """
     Analyzes sentiment of text input using TextBlob
@@ -52,9 +144,18 @@ class SentimentAnalyzer:
     POSITIVE_THRESHOLD = 0.1
     NEGATIVE_THRESHOLD = -0.1
     
+    # Fewest distinct texts for which batch_analyze(workers=...) starts a
+    # process pool
+    PARALLEL_BATCH_MIN = 64
+    
     def __init__(self):
         """Initialize the sentiment analyzer"""
-        pass
+        # Per-word polarity lookup used instead of a TextBlob per word
+        self._word_polarities = _load_word_polarities()
+        
+        # Load TextBlob's lazily initialized models now rather than on the
+        # first request (no-op after the first analyzer in this process)
+        _warm_up_textblob()
     
     def preprocess_text(self, text: str) -> str:
         """
@@ -64,16 +165,18 @@ class SentimentAnalyzer:
         ===========================
         Time Complexity: O(n)
             - html.unescape(): O(n) - scans entire string
-            - re.sub() operations: O(n) each - pattern matching on string
+            - split()/join(): O(n) - whitespace collapse
+            - str.translate() (ASCII) or re.sub() (non-ASCII): O(n)
+            - re.sub() repeat collapse: O(n)
             - Total: O(n) where n = length of text
         
         Space Complexity: O(n)
-            - Each re.sub() creates a new string: O(n)
+            - Each pass creates a new string: O(n)
             - String operations in Python are immutable (create new strings)
-            - Temporary strings during regex operations: O(n)
+            - Temporary word list during whitespace collapse: O(n)
         
         Data Structure Used: String (immutable character array)
-        Algorithm Pattern: Sequential string processing with regex
+        Algorithm Pattern: Sequential string processing with C-level passes
         
         Args:
             text: Raw input text
@@ -84,19 +187,23 @@ class SentimentAnalyzer:
         # HTML entity decode
         text = html.unescape(text)
         
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        # Remove extra whitespace (split() also strips the ends)
+        text = ' '.join(text.split())
         
         # Remove potentially dangerous characters but keep punctuation
         # This helps prevent any injection attempts
-        text = re.sub(r'[^\w\s\.\!\?\,\;\:\-\']', '', text)
+        if text.isascii():
+            text = text.translate(_SANITIZE_TABLE)
+        else:
+            text = _SANITIZE_RE.sub('', text)
         
         # Limit consecutive repeated characters (anti-spam)
-        text = re.sub(r'(.)\1{4,}', r'\1\1\1', text)
+        text = _REPEAT_RE.sub(r'\1\1\1', text)
         
         return text
     
-    def analyze(self, text: str) -> Dict[str, any]:
+    def analyze(self, text: str, include_emotions: bool = True,
+                include_keywords: bool = True) -> dict[str, Any]:
         """
         Analyze sentiment of input text
         
@@ -105,7 +212,7 @@ class SentimentAnalyzer:
         Time Complexity: O(n + m)
             - Input validation: O(1) - constant time checks
             - len(text): O(1) - Python strings cache their length
-            - text.split(): O(n) - splits string into words
+            - text.split(): O(n) - splits string into words (once)
             - preprocess_text(): O(n) - regex operations
             - TextBlob analysis: O(m) where m = number of words/tokens
             - Dictionary construction: O(1) - fixed size dict
@@ -125,6 +232,9 @@ class SentimentAnalyzer:
         
         Args:
             text: Input text to analyze
+            include_emotions: Run emotion detection and include "emotions"
+            include_keywords: Run noun phrase chunking and include
+                "advanced_keywords" (the most expensive optional step)
             
         Returns:
             Dictionary containing:
@@ -135,15 +245,19 @@ class SentimentAnalyzer:
                 - emoji: Corresponding emoji
                 - color: Color code for UI
         """
-        # Validate input
-        if not text or not text.strip():
+        # Validate input (isspace() checks in place, without the copy strip() makes)
+        if not text or text.isspace():
             raise ValueError("Text input cannot be empty")
         
-        # Additional length validation for security
+        # Additional length validation for security. Checked before splitting
+        # so oversized input is rejected without tokenizing it.
         if len(text) > 10000:
             raise ValueError("Text is too long. Maximum 10,000 characters allowed.")
         
-        if len(text.split()) > 2000:
+        # Counted once here and reused for the result. str.split runs in C;
+        # a Python-level character scan would be slower despite skipping the list.
+        word_count = len(text.split())
+        if word_count > 2000:
             raise ValueError("Text contains too many words. Maximum 2,000 words allowed.")
         
         # Preprocess text
@@ -152,10 +266,9 @@ class SentimentAnalyzer:
         if not cleaned_text:
             raise ValueError("Text contains no valid content after preprocessing")
         
-        # Analyze with TextBlob
+        # Analyze with TextBlob (one sentiment lookup for both scores)
         blob = TextBlob(cleaned_text)
-        polarity = blob.sentiment.polarity
-        subjectivity = blob.sentiment.subjectivity
+        polarity, subjectivity = blob.sentiment
         
         # Determine sentiment label
         label, emoji, color = self._classify_sentiment(polarity)
@@ -166,13 +279,7 @@ class SentimentAnalyzer:
         # Extract word-level sentiment analysis
         word_sentiments = self._analyze_word_sentiments(blob)
         
-        # Detect emotions
-        emotions = self._detect_emotions(text, blob, polarity, subjectivity)
-        
-        # Extract advanced keywords
-        advanced_keywords = self._extract_advanced_keywords(blob, word_sentiments)
-        
-        return {
+        result = {
             "label": label,
             "confidence": confidence,
             "polarity": round(polarity, 3),
@@ -180,14 +287,21 @@ class SentimentAnalyzer:
             "emoji": emoji,
             "color": color,
             "text_length": len(text),
-            "word_count": len(text.split()),
+            "word_count": word_count,
             "word_sentiments": word_sentiments,
-            "sentiment_keywords": self._extract_sentiment_keywords(word_sentiments),
-            "emotions": emotions,  # New: emotion detection
-            "advanced_keywords": advanced_keywords  # New: advanced keyword extraction
+            "sentiment_keywords": self._extract_sentiment_keywords(word_sentiments)
         }
+        
+        # Optional sections are only computed when requested
+        if include_emotions:
+            result["emotions"] = self._detect_emotions(text, blob, polarity, subjectivity)
+        
+        if include_keywords:
+            result["advanced_keywords"] = self._extract_advanced_keywords(blob, word_sentiments)
+        
+        return result
     
-    def _classify_sentiment(self, polarity: float) -> Tuple[str, str, str]:
+    def _classify_sentiment(self, polarity: float) -> tuple[str, str, str]:
         """
         Classify sentiment based on polarity score
         
@@ -195,12 +309,11 @@ class SentimentAnalyzer:
         ===========================
         Time Complexity: O(1)
             - Float comparison: O(1) - constant time
-            - If-elif-else branching: O(1) - maximum 3 comparisons
-            - Return tuple creation: O(1)
+            - If-elif-else branching: O(1) - maximum 2 comparisons
+            - Returns a shared module-level tuple: O(1)
         
         Space Complexity: O(1)
-            - Tuple storage: O(1) - fixed 3 elements
-            - No additional data structures
+            - No allocation: the three result tuples are module constants
         
         Algorithm: Simple threshold-based classification
         Optimization: Early exit on first match (if/elif structure)
@@ -212,11 +325,11 @@ class SentimentAnalyzer:
             Tuple of (label, emoji, color)
         """
         if polarity >= self.POSITIVE_THRESHOLD:
-            return "Positive", "😊", "#10b981"  # Green
+            return _POSITIVE
         elif polarity <= self.NEGATIVE_THRESHOLD:
-            return "Negative", "😠", "#ef4444"  # Red
+            return _NEGATIVE
         else:
-            return "Neutral", "😐", "#f59e0b"   # Yellow/Orange
+            return _NEUTRAL
     
     def _calculate_confidence(self, polarity: float, subjectivity: float) -> float:
         """
@@ -227,7 +340,7 @@ class SentimentAnalyzer:
         Time Complexity: O(1)
             - abs(polarity): O(1) - absolute value
             - Arithmetic operations: O(1) - multiplication, addition
-            - max()/min() with 2 args: O(1) - constant comparisons
+            - Upper-bound comparison: O(1)
             - round(): O(1)
         
         Space Complexity: O(1)
@@ -253,28 +366,32 @@ class SentimentAnalyzer:
         # Combined confidence
         confidence = polarity_confidence * subjectivity_factor
         
-        # Ensure confidence is between 0 and 100
-        confidence = max(0, min(100, confidence))
+        # Both factors are non-negative, so only the upper bound needs a guard
+        if confidence > 100:
+            confidence = 100
         
         return round(confidence, 2)
     
-    def _analyze_word_sentiments(self, blob: TextBlob) -> List[Dict]:
+    def _analyze_word_sentiments(self, blob: TextBlob) -> list[dict]:
         """
         Analyze sentiment contribution of individual words
         
         COMPLEXITY ANALYSIS (DSA):
         ===========================
-        Time Complexity: O(m)
+        Time Complexity: O(m log m)
             - Iterate through m words: O(m)
-            - TextBlob sentiment per word: O(1) per word (pre-computed)
-            - Total: O(m) where m = number of words
+            - Lexicon dict lookup per word: O(1) average (hash table)
+            - Non-alphabetic tokens fall back to a TextBlob per token
+            - Sort by impact: O(m log m)
+            - Total: O(m log m) where m = number of words
         
         Space Complexity: O(m)
             - List of m word dictionaries: O(m)
             - Each dictionary: O(1) - fixed 4 keys
+            - Shared lexicon table: O(1) per call (built once per process)
         
-        Data Structure: List of Dictionaries
-        Algorithm: Sequential word analysis with sentiment scoring
+        Data Structures: List of Dictionaries, Dictionary (lexicon lookup)
+        Algorithm: Sequential word analysis with table-driven sentiment scoring
         
         Args:
             blob: TextBlob object with analyzed text
@@ -283,6 +400,7 @@ class SentimentAnalyzer:
             List of dictionaries with word sentiment data
         """
         word_sentiments = []
+        word_polarities = self._word_polarities
         
         # Analyze each word's contribution
         for word in blob.words:
@@ -290,65 +408,48 @@ class SentimentAnalyzer:
             if len(word) <= 2:
                 continue
             
-            # Get word sentiment using TextBlob
-            word_blob = TextBlob(str(word))
-            word_polarity = word_blob.sentiment.polarity
+            # Lowercased once for both the lookup and the result (a plain
+            # str: Word.lower() does not return a Word)
+            word_lower = word.lower()
+            
+            # Alphabetic words score straight from the lexicon; anything else
+            # (contractions, hyphenated or numeric tokens) can be split by the
+            # sentiment tokenizer, so it still goes through TextBlob
+            if word.isalpha():
+                word_polarity = word_polarities.get(word_lower, 0.0)
+            else:
+                word_polarity = TextBlob(str(word)).sentiment.polarity
             
             # Only include words with sentiment (non-zero polarity)
             if word_polarity != 0:
-                sentiment_type = self._get_word_sentiment_type(word_polarity)
-                
                 word_sentiments.append({
-                    "word": str(word).lower(),
+                    "word": word_lower,
                     "polarity": round(word_polarity, 3),
-                    "sentiment": sentiment_type,
+                    "sentiment": "Positive" if word_polarity > 0 else "Negative",
                     "impact": abs(word_polarity)  # Magnitude of impact
                 })
         
         # Sort by impact (most influential words first)
-        word_sentiments.sort(key=lambda x: x["impact"], reverse=True)
+        word_sentiments.sort(key=itemgetter("impact"), reverse=True)
         
         return word_sentiments
     
-    def _get_word_sentiment_type(self, polarity: float) -> str:
-        """
-        Get sentiment type for a single word
-        
-        COMPLEXITY ANALYSIS (DSA):
-        ===========================
-        Time Complexity: O(1)
-        Space Complexity: O(1)
-        
-        Args:
-            polarity: Word polarity score
-            
-        Returns:
-            Sentiment type string
-        """
-        if polarity > 0:
-            return "Positive"
-        elif polarity < 0:
-            return "Negative"
-        else:
-            return "Neutral"
-    
-    def _extract_sentiment_keywords(self, word_sentiments: List[Dict]) -> Dict[str, List[Dict]]:
+    def _extract_sentiment_keywords(self, word_sentiments: list[dict]) -> dict[str, list[dict]]:
         """
         Extract top positive and negative keywords
         
         COMPLEXITY ANALYSIS (DSA):
         ===========================
         Time Complexity: O(m)
-            - Filter positive words: O(m)
-            - Filter negative words: O(m)
-            - Slicing top 5: O(1)
+            - Single pass partitioning positive/negative words: O(m)
             - Total: O(m) where m = number of sentiment words
         
         Space Complexity: O(k)
             - Two lists with max 5 elements each: O(k) where k ≤ 10
         
         Data Structure: Dictionary with Lists
-        Algorithm: Filter and slice
+        Algorithm: Single-pass partition, keeping the first 5 of each side
+        (input is already sorted by impact) and counting the rest
         
         Args:
             word_sentiments: List of word sentiment dictionaries
@@ -356,18 +457,29 @@ class SentimentAnalyzer:
         Returns:
             Dictionary with top positive and negative keywords
         """
-        # Separate positive and negative words
-        positive_words = [w for w in word_sentiments if w["sentiment"] == "Positive"]
-        negative_words = [w for w in word_sentiments if w["sentiment"] == "Negative"]
+        # Separate positive and negative words in one pass. The totals need
+        # the whole list, but only the top 5 of each side are kept.
+        positive_words, negative_words = [], []
+        total_positive = total_negative = 0
+        for w in word_sentiments:
+            sentiment = w["sentiment"]
+            if sentiment == "Positive":
+                total_positive += 1
+                if total_positive <= 5:
+                    positive_words.append(w)
+            elif sentiment == "Negative":
+                total_negative += 1
+                if total_negative <= 5:
+                    negative_words.append(w)
         
         return {
-            "positive": positive_words[:5],  # Top 5 positive words
-            "negative": negative_words[:5],  # Top 5 negative words
-            "total_positive": len(positive_words),
-            "total_negative": len(negative_words)
+            "positive": positive_words,  # Top 5 positive words
+            "negative": negative_words,  # Top 5 negative words
+            "total_positive": total_positive,
+            "total_negative": total_negative
         }
     
-    def _detect_emotions(self, text: str, blob: TextBlob, polarity: float, subjectivity: float) -> Dict[str, Any]:
+    def _detect_emotions(self, text: str, blob: TextBlob, polarity: float, subjectivity: float) -> dict[str, Any]:
         """
         Detect emotions using keyword matching and sentiment analysis
         
@@ -395,31 +507,13 @@ class SentimentAnalyzer:
         """
         text_lower = text.lower()
         
-        # Emotion keyword patterns (Plutchik's wheel of emotions)
-        emotion_keywords = {
-            "joy": ["happy", "joy", "delight", "pleasure", "love", "amazing", "wonderful", 
-                    "fantastic", "excellent", "great", "good", "glad", "cheerful", "excited"],
-            "sadness": ["sad", "unhappy", "depressed", "sorrow", "grief", "miserable", 
-                        "disappointed", "unfortunate", "terrible", "awful", "bad"],
-            "anger": ["angry", "mad", "furious", "rage", "hate", "irritated", "annoyed", 
-                      "frustrated", "outraged", "hostile"],
-            "fear": ["afraid", "scared", "fear", "terrified", "anxious", "worried", 
-                     "nervous", "panic", "frightened"],
-            "surprise": ["surprise", "amazed", "astonished", "shocked", "unexpected", 
-                         "stunned", "wow"],
-            "disgust": ["disgust", "revolting", "gross", "nasty", "horrible", "repulsive"],
-            "trust": ["trust", "reliable", "confident", "secure", "safe", "believe"],
-            "anticipation": ["expect", "anticipate", "hope", "await", "eager", "looking forward"]
-        }
-        
-        # Initialize emotion scores
-        emotion_scores = {emotion: 0 for emotion in emotion_keywords.keys()}
-        
-        # Count keyword matches
-        for emotion, keywords in emotion_keywords.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    emotion_scores[emotion] += 1
+        # Count keyword matches. A substring check per keyword is kept on
+        # purpose: "goodbye" counts for joy and "unhappy" for both sadness
+        # and joy, which word-boundary or alternation matching would change.
+        emotion_scores = _EMOTION_ZERO.copy()
+        for keyword, emotion in _EMOTION_KEYWORD_PAIRS:
+            if keyword in text_lower:
+                emotion_scores[emotion] += 1
         
         # Adjust scores based on sentiment polarity
         if polarity > 0.5:
@@ -435,17 +529,29 @@ class SentimentAnalyzer:
             emotion_scores["surprise"] += subjectivity * 1.5
             emotion_scores["anticipation"] += subjectivity * 1.5
         
-        # Normalize to 0-100 scale
-        max_score = max(emotion_scores.values()) if max(emotion_scores.values()) > 0 else 1
-        normalized_scores = {k: round((v / max_score) * 100, 1) for k, v in emotion_scores.items()}
+        max_score = max(emotion_scores.values())
+        
+        # No keyword hit and no sentiment adjustment: nothing to normalize or rank
+        if not max_score:
+            return {
+                "primary_emotion": _DEFAULT_PRIMARY_EMOTION,
+                "emotion_scores": _EMOTION_ZERO_NORMALIZED.copy(),
+                "confidence": 0.0,
+                "top_emotions": [],
+                "emotion_detected": False
+            }
         
-        # Find primary emotion
-        primary_emotion = max(normalized_scores, key=normalized_scores.get)
-        confidence = normalized_scores[primary_emotion]
+        # Normalize to 0-100 scale
+        # Normalized in place: the raw scores are not needed afterwards
+        normalized_scores = emotion_scores
+        for k, v in normalized_scores.items():
+            normalized_scores[k] = round((v / max_score) * 100, 1)
         
-        # Get top 3 emotions
-        sorted_emotions = sorted(normalized_scores.items(), key=lambda x: x[1], reverse=True)
-        top_emotions = [{"emotion": e[0], "score": e[1]} for e in sorted_emotions[:3] if e[1] > 0]
+        # One stable sort gives both the primary emotion (the first emotion
+        # with the highest score, as max() would pick) and the top 3
+        sorted_emotions = sorted(normalized_scores.items(), key=itemgetter(1), reverse=True)
+        primary_emotion, confidence = sorted_emotions[0]
+        top_emotions = [{"emotion": e, "score": score} for e, score in sorted_emotions[:3] if score > 0]
         
         return {
             "primary_emotion": primary_emotion.capitalize(),
@@ -455,7 +561,7 @@ class SentimentAnalyzer:
             "emotion_detected": confidence > 20
         }
     
-    def _extract_advanced_keywords(self, blob: TextBlob, word_sentiments: List[Dict]) -> Dict[str, Any]:
+    def _extract_advanced_keywords(self, blob: TextBlob, word_sentiments: list[dict]) -> dict[str, Any]:
         """
         Extract keywords using frequency analysis and noun phrase extraction
         
@@ -480,9 +586,9 @@ class SentimentAnalyzer:
         Returns:
             Dictionary with extracted keywords
         """
-        # Extract noun phrases
-        noun_phrases = list(blob.noun_phrases)
-        phrase_freq = Counter(noun_phrases)
+        # Extract noun phrases. Counted straight from the cached WordList:
+        # repeated phrases still rank first, so the Counter stays.
+        phrase_freq = Counter(blob.noun_phrases)
         top_phrases = [phrase for phrase, _ in phrase_freq.most_common(5)]
         
         # Get word frequencies (excluding short words)
@@ -500,50 +606,101 @@ class SentimentAnalyzer:
             "total_keywords": len(set(top_words + sentiment_words))
         }
     
-    def batch_analyze(self, texts: list) -> list:
+    def batch_analyze(self, texts: list[str], workers: int | None = None) -> list[dict[str, Any]]:
         """
         Analyze multiple texts at once
         
         COMPLEXITY ANALYSIS :
         ===========================
-        Time Complexity: O(k * (n + m))
-            - Iterate through k texts: O(k)
-            - Each analyze() call: O(n + m) per text
-            - Total: O(k * (n + m)) where k = number of texts
+        Time Complexity: O(u * (n + m) / p + k)
+            - Deduplicate k texts: O(k)
+            - analyze() runs once per distinct text: O(n + m) each
+            - Spread over p worker processes when workers is set
+            - Repeated texts: O(1) hash lookup + shallow dict copy
+            - Total: O(u * (n + m) / p + k) where u = distinct texts (u <= k)
         
         Space Complexity: O(k * n)
             - Results list: O(k) - stores k analysis results
-            - Each result dict: O(n) - contains text copies
+            - Memo of distinct results: O(u)
             - Total: O(k * n)
         
         Data Structures:
             1. List (Dynamic Array) - for results collection
-            2. Dictionary - for each result
+            2. Dictionary (Hash Table) - memo of results by text
         
-        Algorithm: Sequential batch processing (no parallelization)
-        Potential Optimization: Parallel processing for large batches
+        Algorithm: Batch processing with per-batch memoization, optionally
+        parallelized across processes. analyze() is pure-Python CPU work that
+        holds the GIL, so threads would not speed it up.
         
         Args:
             texts: List of text strings
+            workers: Number of worker processes. None (default) analyzes
+                sequentially in this process. Starting a pool costs far more
+                than a short text, so batches with fewer than
+                PARALLEL_BATCH_MIN distinct texts stay sequential whatever
+                the value. Each worker builds its own instance of this
+                analyzer's class, so subclass overrides apply there too
+                (state set on this instance after construction does not).
+                On spawn-based platforms (Windows, macOS) call this from
+                under an ``if __name__ == "__main__":`` guard.
             
         Returns:
             List of analysis results
         """
+        distinct = list(dict.fromkeys(texts))  # Duplicates skip the NLP pipeline
+        
+        if workers is not None and workers > 1 and len(distinct) >= self.PARALLEL_BATCH_MIN:
+            # A few chunks per worker keeps the pool balanced when some texts
+            # are much longer than others, without paying IPC per text
+            chunksize = max(1, len(distinct) // (4 * workers))
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(type(self),)) as pool:
+                by_text = dict(zip(distinct, pool.map(_worker_analyze, distinct, chunksize=chunksize)))
+        else:
+            by_text = {text: _analyze_for_batch(self, text) for text in distinct}
+        
         results = []
+        emitted = set()
         for text in texts:
-            try:
-                result = self.analyze(text)
-                result["original_text"] = text
-                results.append(result)
-            except ValueError as e:
-                results.append({
-                    "original_text": text,
-                    "error": str(e)
-                })
+            result = by_text[text]
+            if text in emitted:
+                # Each position gets its own top-level dict; nested values are shared
+                result = dict(result)
+            else:
+                emitted.add(text)
+            results.append(result)
         
         return results
 
 
+def _analyze_for_batch(analyzer: SentimentAnalyzer, text: str) -> dict[str, Any]:
+    """Analyze one batch item, reporting validation errors in the result"""
+    try:
+        result = analyzer.analyze(text)
+        result["original_text"] = text
+    except ValueError as e:
+        result = {
+            "original_text": text,
+            "error": str(e)
+        }
+    return result
+
+
+# Analyzer owned by a batch_analyze worker process
+_worker_analyzer = None
+
+
+def _init_worker(analyzer_class: type[SentimentAnalyzer]):
+    """ProcessPoolExecutor initializer: build this process's analyzer once"""
+    global _worker_analyzer
+    _worker_analyzer = analyzer_class()
+
+
+def _worker_analyze(text: str) -> dict[str, Any]:
+    """Analyze one text inside a batch_analyze worker process"""
+    return _analyze_for_batch(_worker_analyzer, text)
+
+
 # Singleton instance
 _analyzer = None
 
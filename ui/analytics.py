@@ -18,9 +18,6 @@ DSA Complexity:
 """
 
 import streamlit as st
-import plotly.express as px
-import plotly.graph_objects as go
-import pandas as pd
 from collections import Counter
 from datetime import datetime
 
@@ -53,6 +50,12 @@ def render():
         st.info("👋 No analyses yet! Go to the Home page to analyze some text.")
         return
     
+    # Charting libraries are imported on first use (then cached in
+    # sys.modules), so app start-up and the empty dashboard don't wait for them
+    import plotly.express as px
+    import plotly.graph_objects as go
+    import pandas as pd
+    
     # =========================================================================
     # DATA AGGREGATION
     # =========================================================================
@@ -424,8 +427,8 @@ def render():
            - Used to track word frequencies and aggregate sentiment data
            - Enables fast keyword counting across all analyses
         
-        2. **List** - O(1) append for history storage
-           - Stores analysis results in chronological order
+        2. **Deque** - O(1) bounded insert for history storage
+           - Stores the last 10 analysis results, newest first
            - Efficient iteration for statistics computation
         
         3. **Counter** - O(n) frequency counting
@@ -44,12 +44,58 @@ License: MIT
 # ============================================================================
 
 import streamlit as st  # Main web framework
-import plotly.graph_objects as go  # Interactive visualizations (gauge chart)
-from sentiment.analyzer import get_analyzer  # Sentiment analysis engine
+from sentiment.analyzer import SentimentAnalyzer  # Sentiment analysis engine
 from datetime import datetime  # Timestamp generation for history
+from collections import deque  # Bounded history (newest first)
+from itertools import islice  # First entries of the history deque
 from utils.security import InputValidator, RateLimiter, SecurityLogger  # Security utilities
 
 
+# ============================================================================
+# DISPLAY LOOKUP TABLES
+# ============================================================================
+
+# Icons for the capitalized primary/top emotion names
+_EMOTION_ICONS = {
+    "Joy": "😊",
+    "Sadness": "😢",
+    "Anger": "😡",
+    "Fear": "😰",
+    "Surprise": "😲",
+    "Disgust": "🤢",
+    "Trust": "🤝",
+    "Anticipation": "🤔"
+}
+
+# Icons for the lowercase emotion score keys (simple emotion format)
+_EMOTION_SCORE_ICONS = {
+    'joy': '😊', 'sadness': '😢', 'anger': '😠', 'fear': '😨',
+    'surprise': '😲', 'disgust': '🤢', 'trust': '🤝', 'anticipation': '🤔'
+}
+
+# Dot shown before each word in the word sentiment list
+_WORD_SENTIMENT_COLORS = {
+    'positive': '🟢',
+    'negative': '🔴',
+    'neutral': '⚪'
+}
+
+
+# ============================================================================
+# SHARED ANALYZER
+# ============================================================================
+
+@st.cache_resource(show_spinner=False)
+def load_analyzer() -> SentimentAnalyzer:
+    """
+    Analyzer instance shared by all Streamlit sessions
+    
+    Built once per server process and kept across script reruns. It holds
+    only the loaded models, no user text.
+    """
+    return SentimentAnalyzer()
+
+
 # ============================================================================
 # MAIN RENDER FUNCTION
 # ============================================================================
@@ -90,15 +136,21 @@ def render():
     st.markdown("### Analyze text sentiment with AI-powered NLP")  # Subtitle
     st.markdown("---")  # Horizontal divider for visual separation
     
+    # Build the shared analyzer (st.cache_resource) while the page loads, so
+    # the first Analyze click doesn't also pay for loading TextBlob's models.
+    # Every later call is a cache lookup.
+    load_analyzer()
+    
     # =========================================================================
     # SESSION STATE INITIALIZATION - Set up history tracking
     # =========================================================================
     
-    # Initialize history list in session state if it doesn't exist
+    # Initialize history in session state if it doesn't exist
     # Session state persists across Streamlit reruns
-    # History stores the last 10 sentiment analyses
+    # History stores the last 10 sentiment analyses: a deque with maxlen
+    # drops the oldest entry itself when a new one is added at the front
     if "history" not in st.session_state:
-        st.session_state.history = []  # Empty list to start
+        st.session_state.history = deque(maxlen=10)  # Empty to start
     
     # Main layout - two columns
     col1, col2 = st.columns([2, 1])
@@ -199,23 +251,19 @@ def render():
                         with st.spinner("🔄 Analyzing sentiment..."):
                             try:
                                 # Get analyzer and perform analysis
-                                analyzer = get_analyzer()
+                                analyzer = load_analyzer()
                                 result = analyzer.analyze(sanitized_text)
                                 
                                 # Increment counter
                                 st.session_state.analysis_count = st.session_state.get("analysis_count", 0) + 1
                                 
-                                # Add to history
-                                st.session_state.history.insert(0, {
+                                # Add to history (newest first; the oldest of 10 is dropped)
+                                st.session_state.history.appendleft({
                                     "text": sanitized_text[:100] + "..." if len(sanitized_text) > 100 else sanitized_text,
                                     "result": result,
                                     "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                                 })
                                 
-                                # Keep only last 10 analyses
-                                if len(st.session_state.history) > 10:
-                                    st.session_state.history = st.session_state.history[:10]
-                                
                                 # Log successful analysis
                                 SecurityLogger.log_event("analysis_success", f"Analyzed {len(sanitized_text)} characters")
                     
@@ -260,6 +308,10 @@ def render():
                                 # Visual gauge chart
                                 st.markdown("#### 🎯 Sentiment Polarity Gauge")
                                 
+                                # Plotly is imported on first use (then cached in sys.modules),
+                                # so loading the page doesn't wait for it
+                                import plotly.graph_objects as go
+                                
                                 fig = go.Figure(go.Indicator(
                                     mode="gauge+number+delta",
                                     value=result['polarity'],
@@ -330,18 +382,7 @@ def render():
                                             primary_emotion = emotions.get('primary_emotion', 'Neutral')
                                             confidence = emotions.get('confidence', 0)
                                             
-                                            emotion_icons = {
-                                                "Joy": "😊",
-                                                "Sadness": "😢",
-                                                "Anger": "😡",
-                                                "Fear": "😰",
-                                                "Surprise": "😲",
-                                                "Disgust": "🤢",
-                                                "Trust": "🤝",
-                                                "Anticipation": "🤔"
-                                            }
-                                            
-                                            icon = emotion_icons.get(primary_emotion, "😐")
+                                            icon = _EMOTION_ICONS.get(primary_emotion, "😐")
                                             
                                             st.markdown(f"""
                                             <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
@@ -360,7 +401,7 @@ def render():
                                             for emo in top_emotions:
                                                 emotion_name = emo['emotion'].capitalize()
                                                 score = emo['score']
-                                                icon = emotion_icons.get(emotion_name, "😐")
+                                                icon = _EMOTION_ICONS.get(emotion_name, "😐")
                                                 
                                                 st.markdown(f"{icon} **{emotion_name}**: {score:.1f}%")
                                                 st.progress(score / 100)
@@ -370,12 +411,8 @@ def render():
                                         
                                         for idx, (emotion, score) in enumerate(list(emotions.items())[:4]):
                                             with emotion_cols[idx]:
-                                                emoji_map = {
-                                                    'joy': '😊', 'sadness': '😢', 'anger': '😠', 'fear': '😨',
-                                                    'surprise': '😲', 'disgust': '🤢', 'trust': '🤝', 'anticipation': '🤔'
-                                                }
                                                 st.metric(
-                                                    label=f"{emoji_map.get(emotion, '💭')} {emotion.title()}",
+                                                    label=f"{_EMOTION_SCORE_ICONS.get(emotion, '💭')} {emotion.title()}",
                                                     value=f"{score}%"
                                                 )
                                         
@@ -398,12 +435,14 @@ def render():
                                         noun_phrases = advanced_keywords.get('noun_phrases', [])
                                         if noun_phrases:
                                             st.markdown("**📝 Key Phrases:**")
-                                            for phrase in noun_phrases[:5]:
-                                                st.markdown(f"• `{phrase}`")
+                                            # One markdown element for the whole list (one delta, not five)
+                                            st.markdown("\n\n".join(f"• `{phrase}`" for phrase in noun_phrases[:5]))
                                         elif 'key_phrases' in advanced_keywords and advanced_keywords['key_phrases']:
                                             st.markdown("**🎯 Key Phrases:**")
-                                            for phrase, score in advanced_keywords['key_phrases'][:5]:
-                                                st.markdown(f"- `{phrase}` (score: {score:.2f})")
+                                            st.markdown("\n".join(
+                                                f"- `{phrase}` (score: {score:.2f})"
+                                                for phrase, score in advanced_keywords['key_phrases'][:5]
+                                            ))
                                         else:
                                             st.caption("No key phrases detected")
                                     
@@ -412,12 +451,14 @@ def render():
                                         if frequent_words:
                                             st.markdown("**🔤 Most Frequent:**")
                                             # Check if it's a list of tuples or just strings
+                                            word_lines = []
                                             for item in frequent_words[:5]:
                                                 if isinstance(item, tuple):
                                                     word, count = item
-                                                    st.markdown(f"• `{word}` ({count}x)")
+                                                    word_lines.append(f"• `{word}` ({count}x)")
                                                 else:
-                                                    st.markdown(f"• `{item}`")
+                                                    word_lines.append(f"• `{item}`")
+                                            st.markdown("\n\n".join(word_lines))
                                         else:
                                             st.caption("No frequent words detected")
                                 
@@ -439,18 +480,22 @@ def render():
                                         positive_words = sentiment_keywords.get('positive', [])
                                         
                                         if positive_words:
+                                            # Cards are joined into one markdown element (one delta, not five)
+                                            cards = []
                                             for word_data in positive_words[:5]:
                                                 word = word_data['word']
                                                 polarity = word_data['polarity']
                                                 impact = word_data.get('impact', abs(polarity))
                                                 
-                                                st.markdown(f"""
+                                                cards.append(f"""
                                                 <div style='background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%); 
                                                             padding: 10px; border-radius: 8px; margin: 5px 0;'>
                                                     <b style='color: #065f46;'>"{word}"</b><br>
                                                     <small>Polarity: +{polarity:.3f} | Impact: {impact:.3f}</small>
                                                 </div>
-                                                """, unsafe_allow_html=True)
+                                                """)
+                                            
+                                            st.markdown("".join(cards), unsafe_allow_html=True)
                                         else:
                                             st.info("No strong positive words detected")
                                     
@@ -459,32 +504,34 @@ def render():
                                         negative_words = sentiment_keywords.get('negative', [])
                                         
                                         if negative_words:
+                                            cards = []
                                             for word_data in negative_words[:5]:
                                                 word = word_data['word']
                                                 polarity = word_data['polarity']
                                                 impact = word_data.get('impact', abs(polarity))
                                                 
-                                                st.markdown(f"""
+                                                cards.append(f"""
                                                 <div style='background: linear-gradient(135deg, #fee2e2 0%, #fecaca 100%); 
                                                             padding: 10px; border-radius: 8px; margin: 5px 0;'>
                                                     <b style='color: #991b1b;'>"{word}"</b><br>
                                                     <small>Polarity: {polarity:.3f} | Impact: {impact:.3f}</small>
                                                 </div>
-                                                """, unsafe_allow_html=True)
+                                                """)
+                                            
+                                            st.markdown("".join(cards), unsafe_allow_html=True)
                                         else:
                                             st.info("No strong negative words detected")
                                     
                                     # Show all words in expandable section
                                     if word_sentiments:
                                         with st.expander("📋 View All Word Sentiments"):
+                                            word_lines = []
                                             for word_data in word_sentiments[:20]:
-                                                sentiment_color = {
-                                                    'positive': '🟢',
-                                                    'negative': '🔴',
-                                                    'neutral': '⚪'
-                                                }.get(word_data.get('sentiment', 'neutral'), '⚪')
+                                                sentiment_color = _WORD_SENTIMENT_COLORS.get(word_data.get('sentiment', 'neutral'), '⚪')
                                                 
-                                                st.markdown(f"{sentiment_color} **{word_data['word']}** - Polarity: {word_data['polarity']:.3f}")
+                                                word_lines.append(f"{sentiment_color} **{word_data['word']}** - Polarity: {word_data['polarity']:.3f}")
+                                            
+                                            st.markdown("\n\n".join(word_lines))
                                 else:
                                     st.info("No word-level sentiment data available")
                                 
@@ -521,7 +568,7 @@ Timestamp: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
         st.markdown("## 📜 Recent Analyses")
         
         with st.expander("View Analysis History", expanded=False):
-            for idx, item in enumerate(st.session_state.history[:5]):
+            for idx, item in enumerate(islice(st.session_state.history, 5)):
                 col1, col2, col3, col4 = st.columns([3, 1, 1, 2])
                 
                 with col1:
@@ -540,5 +587,5 @@ Timestamp: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
                     st.divider()
             
             if st.button("🗑️ Clear History"):
-                st.session_state.history = []
+                st.session_state.history.clear()
                 st.rerun()
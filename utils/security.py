@@ -53,11 +53,20 @@ License: MIT
 
 import re  # Regular expressions for pattern matching and validation
 import time  # Time tracking for rate limiting and cooldowns
+from collections import deque  # Rolling request log for rate limiting
 from typing import Optional, Tuple  # Type hints for better code documentation
 from datetime import datetime, timedelta  # Date/time handling for sessions and logging
 import streamlit as st  # Streamlit session state for data persistence
 
 
+# Characters counted as "special" by InputValidator.validate_input
+_SPECIAL_CHAR_RE = re.compile(r'[^a-zA-Z0-9\s\.\,\!\?\-\']')
+
+# Deletes every non-special ASCII character: for ASCII text, the length of
+# what is left is the special-character count, computed by str.translate in C
+_NON_SPECIAL_TABLE = {cp: None for cp in range(128) if not _SPECIAL_CHAR_RE.match(chr(cp))}
+
+
 class InputValidator:
     """
     Validates and sanitizes user input for security
@@ -76,6 +85,15 @@ class InputValidator:
         re.IGNORECASE
     )
     
+    # Spam indicators (keywords, symbol runs, too many URLs) as one pattern,
+    # so is_spam scans the text once
+    SPAM_PATTERN = re.compile(
+        r'(viagra|cialis|lottery|winner|prize|click here|buy now)'
+        r'|(\$\$\$|!!!!!!)'
+        r'|(http[s]?://.*){5,}',  # Too many URLs
+        re.IGNORECASE
+    )
+    
     @staticmethod
     def sanitize_text(text: str) -> str:
         """
@@ -131,12 +149,12 @@ class InputValidator:
             - len(text): O(1) - cached length
             - text.split(): O(n) - splits into words
             - regex search (SQL pattern): O(n) - pattern matching
-            - regex findall (special chars): O(n) - scans string
+            - special chars (str.translate for ASCII, else regex): O(n)
             - Total: O(n) linear time
         
         Space Complexity: O(m)
             - text.split(): O(m) - creates list of m words
-            - regex findall: O(k) - list of k matches
+            - special-char count: O(k) - leftover string or list of k matches
             - Other operations: O(1)
             - Total: O(m) where m = number of words
         
@@ -176,7 +194,11 @@ class InputValidator:
             return False, "⚠️ Invalid input detected. Please remove SQL keywords."
         
         # Check for excessive special characters (potential attack)
-        special_char_ratio = len(re.findall(r'[^a-zA-Z0-9\s\.\,\!\?\-\']', text)) / max(len(text), 1)
+        if text.isascii():
+            special_char_count = len(text.translate(_NON_SPECIAL_TABLE))
+        else:
+            special_char_count = len(_SPECIAL_CHAR_RE.findall(text))
+        special_char_ratio = special_char_count / max(len(text), 1)
         if special_char_ratio > 0.5:
             return False, "⚠️ Text contains too many special characters."
         
@@ -189,20 +211,18 @@ class InputValidator:
         
         COMPLEXITY ANALYSIS :
         ===========================
-        Time Complexity: O(p * n)
-            - Iterate through p patterns: O(p)
-            - Each re.search(): O(n) - scans entire text
-            - Total: O(p * n) where p = patterns, n = text length
-            - In practice: O(n) since p is small constant (3)
+        Time Complexity: O(n)
+            - SPAM_PATTERN.search(): O(n) - one scan for all indicators
+            - Total: O(n) where n = text length
         
         Space Complexity: O(1)
-            - List of patterns: O(1) - fixed size (3 patterns)
+            - Pattern compiled once at class definition: O(1)
             - Regex match object: O(1) - reference only
             - No additional storage
         
-        Data Structure: List of compiled regex patterns
-        Algorithm: Sequential pattern matching with early exit
-        Optimization: Returns immediately on first match
+        Data Structure: Compiled regex alternation
+        Algorithm: Single-pass pattern matching with early exit
+        Optimization: Returns on the first match of any indicator
         
         Args:
             text: Input text
@@ -210,17 +230,7 @@ class InputValidator:
         Returns:
             True if spam detected
         """
-        spam_indicators = [
-            r'(viagra|cialis|lottery|winner|prize|click here|buy now)',
-            r'(\$\$\$|!!!!!!)',
-            r'(http[s]?://.*){5,}',  # Too many URLs
-        ]
-        
-        for pattern in spam_indicators:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        
-        return False
+        return InputValidator.SPAM_PATTERN.search(text) is not None
 
 
 class RateLimiter:
@@ -233,6 +243,28 @@ class RateLimiter:
     MAX_REQUESTS_PER_HOUR = 100
     COOLDOWN_SECONDS = 2  # Minimum time between requests
     
+    @staticmethod
+    def _prune(requests: deque, current_time: float):
+        """Drop timestamps older than the 1-hour window from the left of the log"""
+        while requests and current_time - requests[0] >= 3600:
+            requests.popleft()
+    
+    @staticmethod
+    def _count_recent(requests: deque, current_time: float, window: float) -> int:
+        """
+        Count timestamps newer than ``window`` seconds
+        
+        The log is in time order, so scanning from the newest entry stops at
+        the first one outside the window: at most MAX_REQUESTS_PER_MINUTE + 1
+        steps for the 1-minute window.
+        """
+        count = 0
+        for req_time in reversed(requests):
+            if current_time - req_time >= window:
+                break
+            count += 1
+        return count
+    
     @staticmethod
     def check_rate_limit() -> Tuple[bool, Optional[str]]:
         """
@@ -240,31 +272,27 @@ class RateLimiter:
         
         COMPLEXITY ANALYSIS :
         ===========================
-        Time Complexity: O(n)
-            - List comprehension (filter old requests): O(n)
-            - Update session_state list: O(1) amortized
-            - Count recent requests (minute): O(n) - filter operation
-            - list.append(): O(1) amortized (dynamic array)
-            - Total: O(n) where n = number of requests in history
+        Time Complexity: O(1) amortized
+            - Drop expired requests: O(1) amortized - each timestamp is
+              popped from the left of the deque at most once
+            - Count recent requests (minute): O(m) - scan from the newest
+              entry, m ≤ MAX_REQUESTS_PER_MINUTE + 1
+            - Count requests (hour): O(1) - len() of the pruned deque
+            - deque.append(): O(1)
+            - Total: O(1) amortized (bounded by the per-minute limit)
         
         Space Complexity: O(n)
-            - rate_limit_requests list: O(n) - stores timestamps
-            - Recent requests list: O(m) - temporary filtered list
+            - rate_limit_requests deque: O(n) - stores timestamps
             - Maximum n ≤ 100 (hourly limit)
             - Bounded: O(1) in practice due to limit
         
         Data Structures:
-            1. List (Dynamic Array) - stores request timestamps
+            1. Deque (Double-ended Queue) - time-ordered request timestamps
             2. Session State (Dictionary) - O(1) access
         
-        Algorithm: Sliding window rate limiting
-        Pattern: Time-based filtering with list comprehension
-        Optimization: Automatic cleanup of old entries
-        
-        Trade-off Analysis:
-            - Simple implementation vs potential O(n) filter cost
-            - Could use Deque for O(1) append/pop but negligible benefit
-            - List comprehension is Pythonic and readable
+        Algorithm: Sliding window rate limiting (exact request log)
+        Pattern: Expire from the left, append on the right
+        Optimization: No list rebuilt per check; old entries leave as they expire
         
         Returns:
             Tuple of (is_allowed, error_message)
@@ -273,16 +301,14 @@ class RateLimiter:
         
         # Initialize rate limit tracking in session state
         if 'rate_limit_requests' not in st.session_state:
-            st.session_state.rate_limit_requests = []
+            st.session_state.rate_limit_requests = deque()
         
         if 'last_request_time' not in st.session_state:
             st.session_state.last_request_time = 0
         
         # Remove old requests (older than 1 hour)
-        st.session_state.rate_limit_requests = [
-            req_time for req_time in st.session_state.rate_limit_requests
-            if current_time - req_time < 3600  # 1 hour
-        ]
+        requests = st.session_state.rate_limit_requests
+        RateLimiter._prune(requests, current_time)
         
         # Check cooldown period
         time_since_last = current_time - st.session_state.last_request_time
@@ -291,20 +317,15 @@ class RateLimiter:
             return False, f"⏳ Please wait {wait_time:.1f} seconds before analyzing again."
         
         # Check requests per minute
-        recent_requests = [
-            req_time for req_time in st.session_state.rate_limit_requests
-            if current_time - req_time < 60  # 1 minute
-        ]
-        
-        if len(recent_requests) >= RateLimiter.MAX_REQUESTS_PER_MINUTE:
+        if RateLimiter._count_recent(requests, current_time, 60) >= RateLimiter.MAX_REQUESTS_PER_MINUTE:
             return False, "⚠️ Rate limit exceeded. Please wait a minute before trying again."
         
         # Check requests per hour
-        if len(st.session_state.rate_limit_requests) >= RateLimiter.MAX_REQUESTS_PER_HOUR:
+        if len(requests) >= RateLimiter.MAX_REQUESTS_PER_HOUR:
             return False, "⚠️ Hourly limit reached. Please try again later."
         
         # Update tracking
-        st.session_state.rate_limit_requests.append(current_time)
+        requests.append(current_time)
         st.session_state.last_request_time = current_time
         
         return True, None
@@ -316,17 +337,16 @@ class RateLimiter:
         
         COMPLEXITY ANALYSIS :
         ===========================
-        Time Complexity: O(n)
-            - Filter requests (minute): O(n) - list comprehension
-            - Filter requests (hour): O(n) - list comprehension
-            - len() operations: O(1) - list length cached
+        Time Complexity: O(1) amortized
+            - Drop expired requests: O(1) amortized
+            - Count requests (minute): O(m) - newest-first scan, m ≤ 11
+            - Count requests (hour): O(1) - len() of the pruned deque
             - max() with 2 args: O(1)
-            - Total: O(n) where n = number of stored requests
+            - Total: O(1) amortized
         
-        Space Complexity: O(n)
-            - Two filtered lists: O(n) each
+        Space Complexity: O(1)
             - Result dictionary: O(1) - fixed 4 keys
-            - Total: O(n)
+            - No temporary lists
         
         Data Structure: Dictionary (Hash Table) for result
         Algorithm: Time-based filtering and aggregation
@@ -344,15 +364,11 @@ class RateLimiter:
         
         current_time = time.time()
         
-        requests_last_minute = len([
-            req for req in st.session_state.rate_limit_requests
-            if current_time - req < 60
-        ])
+        requests = st.session_state.rate_limit_requests
+        RateLimiter._prune(requests, current_time)
         
-        requests_last_hour = len([
-            req for req in st.session_state.rate_limit_requests
-            if current_time - req < 3600
-        ])
+        requests_last_minute = RateLimiter._count_recent(requests, current_time, 60)
+        requests_last_hour = len(requests)
         
         return {
             'requests_last_minute': requests_last_minute,